@@ -1,6 +1,7 @@
 """Main application module for NIST Studio."""
 
 import sys
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 from mynist.views.main_window import MainWindow
 from mynist.utils.logger import setup_logger
@@ -14,6 +15,8 @@ class NISTStudioApp:
 
     def __init__(self):
         """Initialize application."""
+        # Let QIcon hand out the @2x pixmaps load_svg_icon renders on HiDPI
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
         self.qapp = QApplication(sys.argv)
         self.qapp.setApplicationName(APP_NAME)
 
@@ -1,7 +1,7 @@
 """Contrôleur pour l'export PDF décadactylaire (rapport 10 empreintes)."""
 
 from io import BytesIO
-from typing import List, Tuple, Dict, Optional
+from typing import BinaryIO, List, Tuple, Dict, Optional, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -37,12 +37,15 @@ class PDFController:
         except Exception as exc:
             return None, f"Erreur lors de la génération de l'aperçu : {exc}"
 
-    def export_dacty_pdf(self, nist_file: NISTFile, output_path: str) -> Tuple[bool, str]:
+    def export_dacty_pdf(
+        self, nist_file: NISTFile, output_path: Union[str, BinaryIO]
+    ) -> Tuple[bool, str]:
         """Exporte un PDF décadactylaire organisé (pouces/main gauche/main droite + simultanés + paumes).
 
         Args:
             nist_file: fichier NIST déjà parsé.
-            output_path: chemin de sortie du PDF.
+            output_path: chemin de sortie du PDF, ou objet fichier binaire
+                (ex. io.BytesIO) pour générer le PDF en mémoire.
 
         Returns:
             (succes, message) ; message vide si succès.
@@ -62,6 +62,10 @@ IMPRESSION_TYPES = {
     9: "Swipe",
 }
 
+# Dense tuples indexed by code (None for gaps) for hot-path lookups
+_FINGER_POSITIONS_ARR = tuple(FINGER_POSITIONS.get(i) for i in range(max(FINGER_POSITIONS) + 1))
+_IMPRESSION_TYPES_ARR = tuple(IMPRESSION_TYPES.get(i) for i in range(max(IMPRESSION_TYPES) + 1))
+
 
 def _safe_get(record, attr: str) -> Optional[int]:
     """Safely extract integer-like attribute without raising from nistitl."""
@@ -88,9 +92,11 @@ def describe_biometric_record(record_type: int, record) -> str:
 
     parts = []
     if finger_pos is not None:
-        parts.append(FINGER_POSITIONS.get(finger_pos, f"Position {finger_pos}"))
+        label = _FINGER_POSITIONS_ARR[finger_pos] if 0 <= finger_pos < len(_FINGER_POSITIONS_ARR) else None
+        parts.append(label or f"Position {finger_pos}")
     if impression is not None:
-        parts.append(IMPRESSION_TYPES.get(impression, f"IMP {impression}"))
+        label = _IMPRESSION_TYPES_ARR[impression] if 0 <= impression < len(_IMPRESSION_TYPES_ARR) else None
+        parts.append(label or f"IMP {impression}")
 
     if record_type == 10 and not parts:
         parts.append("Face/SMT image")
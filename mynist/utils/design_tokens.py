@@ -3,13 +3,23 @@
 Simplified version using OS native colors.
 """
 
+import hashlib
+from functools import lru_cache
 from pathlib import Path
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QPalette
-from PyQt5.QtSvg import QSvgRenderer
+from typing import Any, Dict, Optional, Tuple
+
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache, QPainter, QPalette
 from PyQt5.QtWidgets import QApplication
 
 
+# On-disk cache of tinted icon PNGs; set to None to disable it.
+ICON_CACHE_DIR: Optional[Path] = Path.home() / ".cache" / "mynist" / "icons"
+
+# Parsed SVG renderers keyed by (path, color), shared across icon sizes
+_renderer_cache: Dict[Tuple[str, str], Any] = {}
+
+
 class Typography:
     """Font sizes and weights."""
 
@@ -21,6 +31,15 @@ class Typography:
     SIZE_2XL = 24
     SIZE_3XL = 28
 
+    # Pre-formatted CSS lengths for stylesheets
+    SIZE_XS_PX = f"{SIZE_XS}px"
+    SIZE_SM_PX = f"{SIZE_SM}px"
+    SIZE_MD_PX = f"{SIZE_MD}px"
+    SIZE_LG_PX = f"{SIZE_LG}px"
+    SIZE_XL_PX = f"{SIZE_XL}px"
+    SIZE_2XL_PX = f"{SIZE_2XL}px"
+    SIZE_3XL_PX = f"{SIZE_3XL}px"
+
     WEIGHT_NORMAL = 400
     WEIGHT_MEDIUM = 500
     WEIGHT_SEMIBOLD = 600
@@ -39,6 +58,16 @@ class Spacing:
     XXXL = 32
     XXXXL = 48
 
+    # Pre-formatted CSS lengths for stylesheets
+    XS_PX = f"{XS}px"
+    SM_PX = f"{SM}px"
+    MD_PX = f"{MD}px"
+    LG_PX = f"{LG}px"
+    XL_PX = f"{XL}px"
+    XXL_PX = f"{XXL}px"
+    XXXL_PX = f"{XXXL}px"
+    XXXXL_PX = f"{XXXXL}px"
+
 
 class Radius:
     """Border radius values in pixels."""
@@ -48,6 +77,12 @@ class Radius:
     LG = 8
     XL = 12
 
+    # Pre-formatted CSS lengths for stylesheets
+    SM_PX = f"{SM}px"
+    MD_PX = f"{MD}px"
+    LG_PX = f"{LG}px"
+    XL_PX = f"{XL}px"
+
 
 def get_icon_color() -> str:
     """Get appropriate icon color from OS palette."""
@@ -60,46 +95,116 @@ def get_icon_color() -> str:
     return color.name()
 
 
-def load_svg_icon(svg_path: Path, color: str = None, size: int = 24) -> QIcon:
-    """Load an SVG icon and apply a color.
+@lru_cache(maxsize=None)
+def _read_svg(svg_path: str) -> Optional[str]:
+    """Read SVG source once per process (icons ship with the package)."""
+    try:
+        with open(svg_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+def _icon_cache_path(svg_content: str, size: int, color: str, ratio: float) -> Optional[Path]:
+    """Return the on-disk PNG path for a tinted SVG rendering, if caching is on."""
+    if ICON_CACHE_DIR is None:
+        return None
+    key = f"{svg_content}|{size}|{color}|{ratio}".encode('utf-8')
+    return ICON_CACHE_DIR / f"{hashlib.md5(key).hexdigest()}.png"
+
+
+def load_svg_pixmap(
+    svg_path: Path,
+    color: str = None,
+    size: int = 24,
+    device_pixel_ratio: float = 1.0,
+) -> QPixmap:
+    """Render an SVG with a color at the given device pixel ratio.
 
     Args:
         svg_path: Path to SVG file
         color: Hex color string. If None, uses OS text color.
         size: Icon size in pixels
+        device_pixel_ratio: Screen ratio to render at (avoids HiDPI upscaling)
 
     Returns:
-        QIcon with the colored icon
+        QPixmap of size * device_pixel_ratio physical pixels, null on error
     """
-    if not svg_path.exists():
-        return QIcon()
-
     if color is None:
         color = get_icon_color()
 
-    # Read and modify SVG content
-    try:
-        with open(svg_path, 'r', encoding='utf-8') as f:
-            svg_content = f.read()
-    except Exception:
-        return QIcon()
-
-    # Replace color references
-    svg_content = svg_content.replace('currentColor', color)
-    svg_content = svg_content.replace('stroke="currentColor"', f'stroke="{color}"')
+    # Rendered pixmaps are shared process-wide through QPixmapCache
+    cache_key = f"{svg_path}|{size}|{color}|{device_pixel_ratio}"
+    cached = QPixmapCache.find(cache_key)
+    if cached is not None and not cached.isNull():
+        return cached
 
-    # Create renderer from modified SVG
-    renderer = QSvgRenderer(svg_content.encode('utf-8'))
-    if not renderer.isValid():
-        return QIcon()
-
-    # Render to pixmap
-    pixmap = QPixmap(size, size)
+    # Read and modify SVG content
+    svg_content = _read_svg(str(svg_path))
+    if svg_content is None:
+        return QPixmap()
+
+    # Pre-tinted PNG from a previous run skips SVG parsing entirely
+    png_path = _icon_cache_path(svg_content, size, color, device_pixel_ratio)
+    pixmap = QPixmap()
+    if png_path is not None and pixmap.load(str(png_path), "PNG"):
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
+
+    renderer_key = (str(svg_path), color)
+    renderer = _renderer_cache.get(renderer_key)
+    if renderer is None:
+        # Replace color references
+        svg_content = svg_content.replace('currentColor', color)
+        svg_content = svg_content.replace('stroke="currentColor"', f'stroke="{color}"')
+
+        # Create renderer from modified SVG (QtSvg is only loaded when needed)
+        from PyQt5.QtSvg import QSvgRenderer
+
+        renderer = QSvgRenderer(svg_content.encode('utf-8'))
+        if not renderer.isValid():
+            return QPixmap()
+        _renderer_cache[renderer_key] = renderer
+
+    # Render to pixmap at physical resolution
+    physical = round(size * device_pixel_ratio)
+    pixmap = QPixmap(physical, physical)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
     pixmap.fill(Qt.transparent)
 
     painter = QPainter(pixmap)
     painter.setRenderHint(QPainter.Antialiasing)
-    renderer.render(painter)
+    renderer.render(painter, QRectF(0, 0, size, size))
     painter.end()
 
-    return QIcon(pixmap)
+    QPixmapCache.insert(cache_key, pixmap)
+    if png_path is not None:
+        try:
+            png_path.parent.mkdir(parents=True, exist_ok=True)
+            pixmap.save(str(png_path), "PNG")
+        except Exception:
+            # Disk cache is best effort; the icon is still usable.
+            pass
+    return pixmap
+
+
+def load_svg_icon(
+    svg_path: Path,
+    color: str = None,
+    size: int = 24,
+    device_pixel_ratio: float = 1.0,
+) -> QIcon:
+    """Load an SVG icon and apply a color.
+
+    Args:
+        svg_path: Path to SVG file
+        color: Hex color string. If None, uses OS text color.
+        size: Icon size in pixels
+        device_pixel_ratio: Screen ratio to render at (avoids HiDPI upscaling)
+
+    Returns:
+        QIcon with the colored icon
+    """
+    pixmap = load_svg_pixmap(svg_path, color, size, device_pixel_ratio)
+    return QIcon() if pixmap.isNull() else QIcon(pixmap)
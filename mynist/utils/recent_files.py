@@ -1,11 +1,19 @@
 """Recent files persistence and helpers."""
 
 import json
+import os
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterable, List, Optional, Dict, Any
 
+# orjson is optional: faster (de)serialisation, stdlib json otherwise
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
 
 DEFAULT_RECENT_PATH = Path.home() / ".config" / "mynist" / "recent_files.json"
 
@@ -37,39 +45,90 @@ class RecentFileEntry:
         return payload
 
 
+class JsonFileStorage:
+    """Store recent entries as a JSON list on disk."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Return the stored list, or an empty one if the file is absent."""
+        if not self.path.exists():
+            return []
+        if ORJSON_AVAILABLE:
+            return orjson.loads(self.path.read_bytes())
+        with open(self.path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def save(self, payload: List[Dict[str, Any]]):
+        """Write the list, creating the parent directory if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if ORJSON_AVAILABLE:
+            self.path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2)
+
+
+class InMemoryStorage:
+    """Keep recent entries in memory only (tests, throwaway sessions)."""
+
+    def __init__(self):
+        self.data: Optional[List[Dict[str, Any]]] = None
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Return the last saved list, or an empty one."""
+        return self.data or []
+
+    def save(self, payload: List[Dict[str, Any]]):
+        """Remember the list."""
+        self.data = payload
+
+
 class RecentFiles:
     """Manage persistence and retrieval of recent files."""
 
-    def __init__(self, storage_path: Optional[Path] = None, max_entries: int = 8):
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        max_entries: int = 8,
+        exists_fn: Callable[[str], bool] = os.path.exists,
+        storage=None,
+    ):
+        """
+        Create the manager and load stored entries.
+
+        Args:
+            storage_path: JSON file used when no storage backend is given.
+            max_entries: Maximum number of entries kept.
+            exists_fn: Predicate telling whether a path still exists.
+            storage: Backend with load()/save(payload); defaults to a
+                JsonFileStorage on storage_path.
+        """
         self.storage_path = storage_path or DEFAULT_RECENT_PATH
+        self.storage = storage if storage is not None else JsonFileStorage(self.storage_path)
         self.max_entries = max_entries
+        self.exists_fn = exists_fn
         self.entries: List[RecentFileEntry] = []
         self.load()
 
     def load(self):
-        """Load recent files from disk."""
+        """Load recent files from the storage backend."""
         try:
-            if Path(self.storage_path).exists():
-                with open(self.storage_path, "r", encoding="utf-8") as handle:
-                    raw = json.load(handle)
-                self.entries = [
-                    RecentFileEntry.from_dict(item)
-                    for item in raw
-                    if isinstance(item, dict) and item.get("path")
-                ]
-            else:
-                self.entries = []
+            raw = self.storage.load()
+            self.entries = [
+                RecentFileEntry.from_dict(item)
+                for item in raw
+                if isinstance(item, dict) and item.get("path")
+            ]
         except Exception:
             # Do not fail app start on JSON issues; start clean list.
             self.entries = []
 
     def save(self):
-        """Persist current entries to disk."""
+        """Persist current entries through the storage backend."""
         try:
-            storage_path = Path(self.storage_path)
-            storage_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(storage_path, "w", encoding="utf-8") as handle:
-                json.dump([entry.to_dict() for entry in self.entries], handle, indent=2)
+            self.storage.save([entry.to_dict() for entry in self.entries])
         except Exception:
             # Intentionally swallow errors to avoid crashing UI flows.
             return
@@ -102,6 +161,24 @@ class RecentFiles:
         if not path:
             return
 
+        self._insert(path, last_mode, summary_types)
+        self.save()
+
+    def add_many(self, paths: Iterable[str], last_mode: str = "viewer"):
+        """
+        Add several entries in order and persist once.
+
+        Args:
+            paths: File paths, oldest first (the last one ends up on top).
+            last_mode: Mode recorded for every added entry.
+        """
+        for path in paths:
+            if path:
+                self._insert(path, last_mode, None)
+        self.save()
+
+    def _insert(self, path: str, last_mode: str, summary_types: Optional[List[int]]):
+        """Put an entry on top of the in-memory list without saving."""
         normalized = str(Path(path).expanduser())
         timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         new_entry = RecentFileEntry(
@@ -115,7 +192,6 @@ class RecentFiles:
         existing = [entry for entry in self.entries if entry.path != normalized]
         self.entries = [new_entry] + existing
         self.entries = self.entries[: self.max_entries]
-        self.save()
 
     def get_entries(self, include_missing: bool = True) -> List[Dict[str, Any]]:
         """
@@ -126,7 +202,7 @@ class RecentFiles:
         """
         formatted: List[Dict[str, Any]] = []
         for entry in self.entries:
-            exists = Path(entry.path).exists()
+            exists = self.exists_fn(entry.path)
             if not exists and not include_missing:
                 continue
 
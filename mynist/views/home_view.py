@@ -20,6 +20,10 @@ from mynist.utils.constants import APP_NAME, APP_VERSION
 from mynist.utils.design_tokens import Typography, Spacing, Radius, load_svg_icon
 
 
+_ICONS_DIR = Path(__file__).resolve().parent.parent / "resources" / "icons"
+_HUB_ICON_DIR = _ICONS_DIR / "hub"
+
+
 class HomeView(QWidget):
     """Hub screen with mode cards."""
 
@@ -38,7 +42,7 @@ class HomeView(QWidget):
 
     def _get_icon_path(self, name: str) -> Path:
         """Return path to hub icon."""
-        return Path(__file__).parent.parent / "resources" / "icons" / "hub" / f"{name}.svg"
+        return _HUB_ICON_DIR / f"{name}.svg"
 
     def _is_dark_theme(self) -> bool:
         """Detect if the OS is using dark theme."""
@@ -51,11 +55,10 @@ class HomeView(QWidget):
 
     def _get_logo_path(self) -> Path:
         """Return path to appropriate logo based on theme."""
-        icons_dir = Path(__file__).parent.parent / "resources" / "icons"
         if self._is_dark_theme():
-            return icons_dir / "logo-nist-studio-white-short.png"
+            return _ICONS_DIR / "logo-nist-studio-white-short.png"
         else:
-            return icons_dir / "logo-nist-studio-black-short.png"
+            return _ICONS_DIR / "logo-nist-studio-black-short.png"
 
     def _load_icon(self, name: str, size: int = 48) -> QIcon:
         """Load SVG icon with OS-appropriate color."""
@@ -19,7 +19,6 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QSize, QPoint
 from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor, QPen, QPalette
-from PyQt5.QtSvg import QSvgRenderer
 from mynist.views.file_panel import FilePanel
 from mynist.views.data_panel import DataPanel
 from mynist.views.image_panel import ImagePanel
@@ -44,6 +43,8 @@ from mynist.utils.design_tokens import Typography, Spacing, Radius, load_svg_ico
 
 logger = get_logger(__name__)
 
+_HUB_ICON_DIR = Path(__file__).resolve().parent.parent / "resources" / "icons" / "hub"
+
 
 class MainWindow(QMainWindow):
     """Main application window with 3-panel layout."""
@@ -224,8 +225,7 @@ class MainWindow(QMainWindow):
             name: Icon name (without .svg extension)
             size: Icon size in pixels
         """
-        path = Path(__file__).parent.parent / "resources" / "icons" / "hub" / f"{name}.svg"
-        return load_svg_icon(path, size=size)
+        return load_svg_icon(_HUB_ICON_DIR / f"{name}.svg", size=size)
 
     def create_menus(self):
         """Create application menus."""
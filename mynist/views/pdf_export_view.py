@@ -1,9 +1,11 @@
 """Vue dediee a l'export PDF decadactylaire."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer, QEvent
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,9 +18,104 @@ from PyQt5.QtWidgets import (
     QSplitter,
     QFrame,
 )
-from PyQt5.QtGui import QPixmap, QImage
+from PyQt5.QtGui import QIcon, QPixmap, QImage
+
+from mynist.utils.design_tokens import (
+    Typography,
+    Spacing,
+    Radius,
+    get_icon_color,
+    load_svg_icon,
+)
+
+
+_ICON_DIR = Path(__file__).resolve().parent.parent / "resources" / "icons" / "hub"
+
+_NO_FILE_TEXT = "Aucun fichier NIST charge"
+_NO_PREVIEW_TEXT = "Chargez un fichier NIST pour voir l'aperçu"
+_FORMATS_TEXT = "Formats supportes : WSQ, JPEG, PNG, JPEG2000"
+
+# Static content of the info panel, rendered once as a rich-text table
+_INFO_ITEMS = (
+    ("Main gauche", "Pouce, Index, Majeur, Annulaire, Auriculaire"),
+    ("Main droite", "Pouce, Index, Majeur, Annulaire, Auriculaire"),
+    ("Simultane", "Main gauche, Pouces, Main droite"),
+    ("Paumes", "Gauche, Droite"),
+)
 
-from mynist.utils.design_tokens import Typography, Spacing, Radius, load_svg_icon
+_INFO_HTML = (
+    f'<table cellspacing="0" cellpadding="{Spacing.XS}">'
+    + "".join(
+        f'<tr><td width="120"><b>{title} :</b></td><td>{details}</td></tr>'
+        for title, details in _INFO_ITEMS
+    )
+    + "</table>"
+)
+
+# Single root stylesheet, widgets are targeted by objectName
+_STYLESHEET = f"""
+#backBtn {{
+    border-radius: {Radius.MD_PX};
+    padding: {Spacing.SM_PX} {Spacing.LG_PX};
+    font-weight: {Typography.WEIGHT_MEDIUM};
+}}
+#titleLabel {{
+    font-size: {Typography.SIZE_XL_PX};
+    font-weight: {Typography.WEIGHT_SEMIBOLD};
+}}
+#sourceGroup, #destGroup, #infoGroup {{
+    font-weight: {Typography.WEIGHT_SEMIBOLD};
+    font-size: {Typography.SIZE_MD_PX};
+    border-radius: {Radius.LG_PX};
+    margin-top: 14px;
+    padding: {Spacing.LG_PX};
+}}
+#sourceLabel {{
+    font-size: {Typography.SIZE_MD_PX};
+}}
+#outputInput {{
+    padding: {Spacing.SM_PX} {Spacing.MD_PX};
+    border-radius: {Radius.MD_PX};
+    font-size: {Typography.SIZE_MD_PX};
+}}
+#browseBtn {{
+    padding: {Spacing.SM_PX} {Spacing.MD_PX};
+    border-radius: {Radius.MD_PX};
+}}
+#exportBtn {{
+    font-weight: {Typography.WEIGHT_SEMIBOLD};
+    font-size: {Typography.SIZE_MD_PX};
+    padding: {Spacing.MD_PX} {Spacing.XL_PX};
+    border-radius: {Radius.LG_PX};
+}}
+#formatsLabel {{
+    font-size: {Typography.SIZE_SM_PX};
+}}
+#previewPanel {{
+    background-color: #1a1a1a;
+    border-radius: {Radius.LG_PX};
+}}
+#previewTitle {{
+    font-weight: {Typography.WEIGHT_SEMIBOLD};
+    font-size: {Typography.SIZE_MD_PX};
+    color: #ffffff;
+}}
+#previewScroll {{
+    border: none;
+    background-color: #2a2a2a;
+}}
+#previewLabel {{
+    background-color: #1a1a1a;
+    border-radius: {Radius.LG_PX};
+    color: #888888;
+}}
+"""
+
+
+@lru_cache(maxsize=64)
+def _load_icon_cached(path_str: str, size: int, color: str, ratio: float) -> QIcon:
+    """Load a tinted icon once; QIcon is implicitly shared by Qt."""
+    return load_svg_icon(Path(path_str), color=color, size=size, device_pixel_ratio=ratio)
 
 
 class PdfExportView(QWidget):
@@ -35,18 +132,48 @@ class PdfExportView(QWidget):
         super().__init__(parent)
         self.current_file: Optional[str] = None
         self._preview_image = None
+        self._info_built = False
+        self._icon_color: Optional[str] = None
+        self._icon_buttons: List[Tuple[QPushButton, str, int]] = []
         self._build_ui()
 
     def _get_icon_path(self, name: str) -> Path:
         """Return path to hub icon."""
-        return Path(__file__).parent.parent / "resources" / "icons" / "hub" / f"{name}.svg"
+        return _ICON_DIR / f"{name}.svg"
 
-    def _load_icon(self, name: str, size: int = 24):
-        """Load colored icon with OS color."""
+    def _load_icon(self, name: str, size: int = 24) -> Optional[QIcon]:
+        """Load colored icon with OS color, or None if it is unavailable."""
         path = self._get_icon_path(name)
-        return load_svg_icon(path, size=size)
+        ratio = self.devicePixelRatioF()
+        icon = _load_icon_cached(str(path), size, self._get_icon_color(), ratio)
+        return None if icon.isNull() else icon
+
+    def _get_icon_color(self) -> str:
+        """Return the OS icon color, read from the palette once."""
+        if self._icon_color is None:
+            self._icon_color = get_icon_color()
+        return self._icon_color
+
+    def _set_button_icon(self, button: QPushButton, name: str, size: int):
+        """Set a tinted icon on button and remember it for palette changes."""
+        self._icon_buttons.append((button, name, size))
+        icon = self._load_icon(name, size)
+        if icon is not None:
+            button.setIcon(icon)
+
+    def changeEvent(self, event):
+        """Re-tint button icons with the new OS color on palette change."""
+        if event.type() == QEvent.PaletteChange:
+            self._icon_color = None
+            for button, name, size in self._icon_buttons:
+                icon = self._load_icon(name, size)
+                if icon is not None:
+                    button.setIcon(icon)
+        super().changeEvent(event)
 
     def _build_ui(self):
+        self.setStyleSheet(_STYLESHEET)
+
         layout = QVBoxLayout()
         layout.setContentsMargins(Spacing.LG, Spacing.MD, Spacing.LG, Spacing.MD)
         layout.setSpacing(Spacing.MD)
@@ -72,37 +199,21 @@ class PdfExportView(QWidget):
         dest_group = self._build_destination_group()
         left_layout.addWidget(dest_group)
 
-        # Buttons row
-        buttons_row = QHBoxLayout()
-        buttons_row.setSpacing(Spacing.MD)
-
+        # Export button, left-aligned without a wrapping row layout
         self.export_btn = QPushButton("Exporter le PDF")
+        self.export_btn.setObjectName("exportBtn")
         self.export_btn.setCursor(Qt.PointingHandCursor)
         self.export_btn.setMinimumWidth(180)
         self.export_btn.setEnabled(False)
-        self.export_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-weight: {Typography.WEIGHT_SEMIBOLD};
-                font-size: {Typography.SIZE_MD}px;
-                padding: {Spacing.MD}px {Spacing.XL}px;
-                border-radius: {Radius.LG}px;
-            }}
-        """)
-        self.export_btn.clicked.connect(self._on_export_clicked)
-        export_icon = self._load_icon("pdf", 20)
-        if not export_icon.isNull():
-            self.export_btn.setIcon(export_icon)
-        buttons_row.addWidget(self.export_btn)
-
-        buttons_row.addStretch()
-        left_layout.addLayout(buttons_row)
-
-        # Info panel
-        info_group = self._build_info_group()
-        left_layout.addWidget(info_group)
+        # Queued: the export runs after the click returns to the event loop
+        self.export_btn.clicked.connect(self._on_export_clicked, type=Qt.QueuedConnection)
+        self._set_button_icon(self.export_btn, "pdf", 20)
+        left_layout.addWidget(self.export_btn, alignment=Qt.AlignLeft)
 
+        # Info panel is static content, built after first show (see showEvent)
         left_layout.addStretch()
         left_panel.setLayout(left_layout)
+        self._left_layout = left_layout
 
         # Right panel: preview
         right_panel = self._build_preview_panel()
@@ -115,6 +226,19 @@ class PdfExportView(QWidget):
 
         self.setLayout(layout)
 
+    def showEvent(self, event):
+        """Schedule deferred widgets after the first paint."""
+        super().showEvent(event)
+        if not self._info_built:
+            self._info_built = True
+            QTimer.singleShot(0, self._build_secondary_ui)
+
+    def _build_secondary_ui(self):
+        """Add the static info panel once the event loop is idle."""
+        # Insert before the trailing stretch
+        index = self._left_layout.count() - 1
+        self._left_layout.insertWidget(index, self._build_info_group())
+
     def _build_header(self) -> QHBoxLayout:
         """Build header with back button and title."""
         header = QHBoxLayout()
@@ -122,64 +246,45 @@ class PdfExportView(QWidget):
 
         # Back button
         back_btn = QPushButton("Retour au Hub")
-        back_btn.setCursor(Qt.PointingHandCursor)
-        back_btn.setStyleSheet(f"""
-            QPushButton {{
-                border-radius: {Radius.MD}px;
-                padding: {Spacing.SM}px {Spacing.LG}px;
-                font-weight: {Typography.WEIGHT_MEDIUM};
-            }}
-        """)
+        back_btn.setObjectName("backBtn")
         back_btn.clicked.connect(self.back_requested.emit)
-        back_icon = self._load_icon("home", 20)
-        if not back_icon.isNull():
-            back_btn.setIcon(back_icon)
+        self._set_button_icon(back_btn, "home", 20)
         header.addWidget(back_btn)
 
         header.addStretch()
 
         # Title
         title = QLabel("NIST-2-PDF")
-        title.setStyleSheet(f"""
-            font-size: {Typography.SIZE_XL}px;
-            font-weight: {Typography.WEIGHT_SEMIBOLD};
-        """)
+        title.setObjectName("titleLabel")
         header.addWidget(title)
 
         header.addStretch()
 
         # Import button
         import_btn = QPushButton("Importer")
-        import_btn.setCursor(Qt.PointingHandCursor)
-        import_btn.clicked.connect(self.import_requested.emit)
+        import_btn.clicked.connect(self.import_requested.emit, type=Qt.QueuedConnection)
         header.addWidget(import_btn)
 
         # Close button
         self.close_btn = QPushButton("Fermer")
-        self.close_btn.setCursor(Qt.PointingHandCursor)
         self.close_btn.clicked.connect(self.close_requested.emit)
         self.close_btn.setEnabled(False)
         header.addWidget(self.close_btn)
 
+        for btn in (back_btn, import_btn, self.close_btn):
+            btn.setCursor(Qt.PointingHandCursor)
+
         return header
 
     def _build_source_group(self) -> QGroupBox:
         """Build source file display group."""
         group = QGroupBox("Fichier source")
-        group.setStyleSheet(f"""
-            QGroupBox {{
-                font-weight: {Typography.WEIGHT_SEMIBOLD};
-                font-size: {Typography.SIZE_MD}px;
-                border-radius: {Radius.LG}px;
-                margin-top: 14px;
-                padding: {Spacing.LG}px;
-            }}
-        """)
+        group.setObjectName("sourceGroup")
         layout = QVBoxLayout()
         layout.setContentsMargins(Spacing.LG, Spacing.XL, Spacing.LG, Spacing.LG)
 
-        self.source_label = QLabel("Aucun fichier NIST charge")
-        self.source_label.setStyleSheet(f"font-size: {Typography.SIZE_MD}px;")
+        self.source_label = QLabel(_NO_FILE_TEXT)
+        self.source_label.setObjectName("sourceLabel")
         layout.addWidget(self.source_label)
 
         group.setLayout(layout)
@@ -188,37 +293,18 @@ class PdfExportView(QWidget):
     def _build_destination_group(self) -> QGroupBox:
         """Build destination path input group."""
         group = QGroupBox("Destination")
-        group.setStyleSheet(f"""
-            QGroupBox {{
-                font-weight: {Typography.WEIGHT_SEMIBOLD};
-                font-size: {Typography.SIZE_MD}px;
-                border-radius: {Radius.LG}px;
-                margin-top: 14px;
-                padding: {Spacing.LG}px;
-            }}
-        """)
+        group.setObjectName("destGroup")
         layout = QHBoxLayout()
         layout.setContentsMargins(Spacing.LG, Spacing.XL, Spacing.LG, Spacing.LG)
         layout.setSpacing(Spacing.MD)
 
         self.output_input = QLineEdit()
         self.output_input.setPlaceholderText("Chemin du fichier PDF de sortie...")
-        self.output_input.setStyleSheet(f"""
-            QLineEdit {{
-                padding: {Spacing.SM}px {Spacing.MD}px;
-                border-radius: {Radius.MD}px;
-                font-size: {Typography.SIZE_MD}px;
-            }}
-        """)
+        self.output_input.setObjectName("outputInput")
         layout.addWidget(self.output_input, 1)
 
         browse_btn = QPushButton("Parcourir...")
-        browse_btn.setStyleSheet(f"""
-            QPushButton {{
-                padding: {Spacing.SM}px {Spacing.MD}px;
-                border-radius: {Radius.MD}px;
-            }}
-        """)
+        browse_btn.setObjectName("browseBtn")
         browse_btn.clicked.connect(self.browse_requested.emit)
         layout.addWidget(browse_btn)
 
@@ -228,46 +314,23 @@ class PdfExportView(QWidget):
     def _build_info_group(self) -> QGroupBox:
         """Build information panel group."""
         group = QGroupBox("Organisation du releve")
-        group.setStyleSheet(f"""
-            QGroupBox {{
-                font-weight: {Typography.WEIGHT_SEMIBOLD};
-                font-size: {Typography.SIZE_MD}px;
-                border-radius: {Radius.LG}px;
-                margin-top: 14px;
-                padding: {Spacing.LG}px;
-            }}
-        """)
+        group.setObjectName("infoGroup")
         layout = QVBoxLayout()
         layout.setContentsMargins(Spacing.LG, Spacing.XL, Spacing.LG, Spacing.LG)
         layout.setSpacing(Spacing.SM)
 
-        info_items = [
-            ("Main gauche", "Pouce, Index, Majeur, Annulaire, Auriculaire"),
-            ("Main droite", "Pouce, Index, Majeur, Annulaire, Auriculaire"),
-            ("Simultane", "Main gauche, Pouces, Main droite"),
-            ("Paumes", "Gauche, Droite"),
-        ]
-
-        for title, details in info_items:
-            row = QHBoxLayout()
-            row.setContentsMargins(0, 0, 0, 0)
-
-            title_label = QLabel(f"<b>{title} :</b>")
-            title_label.setFixedWidth(120)
-            row.addWidget(title_label)
-
-            details_label = QLabel(details)
-            row.addWidget(details_label)
-            row.addStretch()
-
-            layout.addLayout(row)
+        info_label = QLabel(_INFO_HTML)
+        info_label.setTextFormat(Qt.RichText)
+        layout.addWidget(info_label)
 
         # Formats info
         layout.addSpacing(Spacing.MD)
-        formats_label = QLabel(
-            "<i>Formats supportes : WSQ, JPEG, PNG, JPEG2000</i>"
-        )
-        formats_label.setStyleSheet(f"font-size: {Typography.SIZE_SM}px;")
+        formats_label = QLabel(_FORMATS_TEXT)
+        formats_label.setObjectName("formatsLabel")
+        formats_label.setTextFormat(Qt.PlainText)
+        font = formats_label.font()
+        font.setItalic(True)
+        formats_label.setFont(font)
         layout.addWidget(formats_label)
 
         group.setLayout(layout)
@@ -276,42 +339,25 @@ class PdfExportView(QWidget):
     def _build_preview_panel(self) -> QWidget:
         """Build the PDF preview panel."""
         panel = QFrame()
-        panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: #1a1a1a;
-                border-radius: {Radius.LG}px;
-            }}
-        """)
+        panel.setObjectName("previewPanel")
         layout = QVBoxLayout()
         layout.setContentsMargins(Spacing.MD, Spacing.MD, Spacing.MD, Spacing.MD)
         layout.setSpacing(Spacing.SM)
 
         # Header
-        header = QHBoxLayout()
         title = QLabel("Aperçu du PDF")
-        title.setStyleSheet(f"""
-            font-weight: {Typography.WEIGHT_SEMIBOLD};
-            font-size: {Typography.SIZE_MD}px;
-            color: #ffffff;
-        """)
-        header.addWidget(title)
-        header.addStretch()
-        layout.addLayout(header)
+        title.setObjectName("previewTitle")
+        layout.addWidget(title, alignment=Qt.AlignLeft)
 
         # Scroll area for preview
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #2a2a2a;
-            }
-        """)
+        scroll.setObjectName("previewScroll")
 
         # Preview label
-        self.preview_label = QLabel("Chargez un fichier NIST pour voir l'aperçu")
+        self.preview_label = QLabel(_NO_PREVIEW_TEXT)
         self.preview_label.setAlignment(Qt.AlignCenter)
-        self.preview_label.setStyleSheet("color: #888888;")
+        self.preview_label.setObjectName("previewLabel")
         self.preview_label.setMinimumSize(300, 400)
         scroll.setWidget(self.preview_label)
 
@@ -354,7 +400,7 @@ class PdfExportView(QWidget):
 
     def clear_preview(self):
         """Clear the preview."""
-        self.preview_label.setText("Chargez un fichier NIST pour voir l'aperçu")
+        self.preview_label.setText(_NO_PREVIEW_TEXT)
         self.preview_label.setPixmap(QPixmap())
         self._preview_image = None
 
@@ -365,17 +411,19 @@ class PdfExportView(QWidget):
 
     def set_current_file(self, path: Optional[str]):
         """Update the current file display."""
+        if path == self.current_file:
+            return
         self.current_file = path
         if path:
-            name = Path(path).name
+            name = os.path.basename(path)
             self.source_label.setText(f"{name}")
             # Suggest output path
-            suggested = str(Path(path).with_suffix(".pdf"))
+            suggested = os.path.splitext(path)[0] + ".pdf"
             self.output_input.setText(suggested)
             self.close_btn.setEnabled(True)
             self.export_btn.setEnabled(True)
         else:
-            self.source_label.setText("Aucun fichier NIST charge")
+            self.source_label.setText(_NO_FILE_TEXT)
             self.output_input.clear()
             self.close_btn.setEnabled(False)
             self.export_btn.setEnabled(False)
@@ -0,0 +1,116 @@
+"""Shared pytest fixtures."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Headless Qt everywhere; must be set before the QApplication is created.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+# Parse results keyed on file content: byte-identical fixtures stored under
+# several directories (type7/, type10/, efts_int/) are parsed only once.
+_PARSED = {}
+
+
+def _load_fixture(relative):
+    """Parse a fixture once per distinct content; returns (nist_file, parsed)."""
+    from mynist.models.nist_file import NISTFile
+
+    path = FIXTURES / relative
+    digest = hashlib.md5(path.read_bytes()).hexdigest()
+    if digest not in _PARSED:
+        nist = NISTFile(str(path))
+        _PARSED[digest] = (nist, nist.parse())
+    return _PARSED[digest]
+
+
+def _parse_fixture(relative):
+    nist, parsed = _load_fixture(relative)
+    assert parsed is True
+    return nist
+
+
+@pytest.fixture(autouse=True)
+def offscreen(monkeypatch):
+    """Force Qt to use offscreen platform to avoid GUI requirements."""
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def icon_cache_dir(tmp_path_factory):
+    """Keep the tinted-icon PNG cache out of the real home directory."""
+    try:
+        from mynist.utils import design_tokens
+    except ImportError:
+        # Qt not importable: no icon can be rendered, nothing to redirect.
+        yield None
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        cache_dir = tmp_path_factory.mktemp("icons")
+        mp.setattr(design_tokens, "ICON_CACHE_DIR", cache_dir)
+        yield cache_dir
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Single QApplication for the whole session (one per xdist worker)."""
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication
+
+    if QApplication.instance() is None:
+        # Same attribute as NISTStudioApp; must precede the QApplication
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    app = QApplication.instance() or QApplication(["pytest", "-platform", "offscreen"])
+    yield app
+
+
+@pytest.fixture(scope="module")
+def main_window(qapp):
+    """Single MainWindow shared by the GUI tests of a module."""
+    from mynist.views.main_window import MainWindow
+
+    window = MainWindow()
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def window(main_window):
+    """Shared MainWindow; the file loaded by the test is closed afterwards."""
+    yield main_window
+    # Clear the flag first so closing does not prompt to discard changes
+    main_window.is_modified = False
+    main_window.close_current_file(show_message=False)
+
+
+@pytest.fixture(scope="session")
+def parsed_fixture():
+    """Content-keyed fixture loader; returns (nist_file, parsed)."""
+    return _load_fixture
+
+
+@pytest.fixture(scope="session")
+def parsed_palm15_nist():
+    """Palm export fixture, parsed once per session."""
+    return _parse_fixture("palm15/109018515_export_test.nist")
+
+
+@pytest.fixture(scope="session")
+def parsed_signa_nist():
+    """Signa export fixture, parsed once per session."""
+    return _parse_fixture("signa/102556281_export_test.nist")
+
+
+@pytest.fixture(scope="session")
+def pdf_controller():
+    """PDFController is stateless (dpi only), so one instance serves all tests."""
+    from mynist.controllers.pdf_controller import PDFController
+
+    return PDFController()
@@ -17,6 +17,14 @@ def test_describe_biometric_record_fingerprint():
     assert "Livescan" in text
 
 
+def test_describe_biometric_record_unknown_codes_fall_back():
+    record = SimpleNamespace(_003=42, _004=11)  # FGP 11 is a gap in the table
+    assert describe_biometric_record(14, record) == "Position 11 — IMP 42"
+
+    record = SimpleNamespace(_003=-1, _004=-1)
+    assert describe_biometric_record(14, record) == "Position -1 — IMP -1"
+
+
 def test_describe_biometric_record_type10_default():
     record = SimpleNamespace()
     assert describe_biometric_record(10, record) == "Face/SMT image"
@@ -1,9 +1,7 @@
 """Tests pour la vue comparaison (annotations typées, rotation, mesures, liens)."""
 
-import pytest
-
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QApplication, QGraphicsScene
+from PyQt5.QtWidgets import QGraphicsScene
 
 from PIL import Image
 
@@ -18,14 +16,6 @@ from mynist.views.comparison_view import (
 )
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class TestAnnotationPoint:
     def test_creation_with_type_and_label(self, qapp):
         point = AnnotationPoint(100, 200, "MATCH", "M1")
@@ -1,10 +1,14 @@
 """Test suite for controllers."""
 
+from pathlib import Path
+
 import pytest
 from mynist.controllers.file_controller import FileController
 from mynist.controllers.export_controller import ExportController
 
-FIXTURE_TRUNC = "tests/fixtures/tronques/Interpol_FABLStemp8865791272998619994.NST-neu.nst"
+FIXTURE_TRUNC = (
+    Path(__file__).parent / "fixtures" / "tronques" / "Interpol_FABLStemp8865791272998619994.NST-neu.nst"
+)
 
 class TestFileController:
     """Tests for FileController class."""
@@ -48,7 +52,7 @@ class TestFileController:
     def test_open_truncated_file_sets_error(self):
         """Truncated files should fail without crashing and set an error."""
         controller = FileController()
-        result = controller.open_file(FIXTURE_TRUNC)
+        result = controller.open_file(str(FIXTURE_TRUNC))
         assert result is None
         assert controller.last_error
         assert "NIST_TOO_SHORT" in controller.last_error or "tronqué" in controller.format_last_error()
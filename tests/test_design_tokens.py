@@ -0,0 +1,67 @@
+"""Tests for tinted SVG icon loading and its caches."""
+
+from pathlib import Path
+
+from PyQt5.QtGui import QPixmapCache
+
+from mynist.utils import design_tokens
+from mynist.utils.design_tokens import load_svg_icon, load_svg_pixmap
+
+
+HOME_ICON = Path(design_tokens.__file__).resolve().parent.parent / "resources" / "icons" / "hub" / "home.svg"
+
+
+def _clear_memory_caches():
+    QPixmapCache.clear()
+    design_tokens._renderer_cache.clear()
+
+
+def test_load_svg_icon_served_from_png_cache(qapp, icon_cache_dir):
+    _clear_memory_caches()
+    icon = load_svg_icon(HOME_ICON, color="#123456", size=20)
+    assert not icon.isNull()
+    assert list(icon_cache_dir.glob("*.png"))
+
+    _clear_memory_caches()
+    icon = load_svg_icon(HOME_ICON, color="#123456", size=20)
+
+    assert not icon.isNull()
+    # No SVG renderer was built: the pixmap came from the PNG
+    assert design_tokens._renderer_cache == {}
+
+
+def test_load_svg_icon_unwritable_cache_dir(qapp, tmp_path, monkeypatch):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setattr(design_tokens, "ICON_CACHE_DIR", blocker / "icons")
+    _clear_memory_caches()
+
+    icon = load_svg_icon(HOME_ICON, color="#654321", size=20)
+
+    assert not icon.isNull()
+
+
+def test_load_svg_icon_disk_cache_disabled(qapp, icon_cache_dir, monkeypatch):
+    monkeypatch.setattr(design_tokens, "ICON_CACHE_DIR", None)
+    before = set(icon_cache_dir.glob("*.png"))
+    _clear_memory_caches()
+
+    icon = load_svg_icon(HOME_ICON, color="#abcdef", size=20)
+
+    assert not icon.isNull()
+    assert set(icon_cache_dir.glob("*.png")) == before
+
+
+def test_load_svg_pixmap_device_pixel_ratio(qapp):
+    _clear_memory_caches()
+
+    pixmap = load_svg_pixmap(HOME_ICON, color="#112233", size=20, device_pixel_ratio=2)
+
+    assert (pixmap.width(), pixmap.height()) == (40, 40)
+    assert pixmap.devicePixelRatio() == 2
+
+    # The PNG path must restore the ratio as well
+    QPixmapCache.clear()
+    pixmap = load_svg_pixmap(HOME_ICON, color="#112233", size=20, device_pixel_ratio=2)
+    assert (pixmap.width(), pixmap.height()) == (40, 40)
+    assert pixmap.devicePixelRatio() == 2
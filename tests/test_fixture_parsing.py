@@ -4,8 +4,6 @@ from pathlib import Path
 
 import pytest
 
-from mynist.models.nist_file import NISTFile
-
 
 BASE = Path(__file__).parent / "fixtures"
 
@@ -27,12 +25,11 @@ BASE = Path(__file__).parent / "fixtures"
         ("tronques/Interpol_NIST_File_INTERPOL_V5.03_-_730020_06N.nst", set(), False),
     ],
 )
-def test_fixture_parsing(relative, required_types, should_parse):
+def test_fixture_parsing(parsed_fixture, relative, required_types, should_parse):
     fixture_path = BASE / relative
     assert fixture_path.exists(), f"Fixture missing: {fixture_path}"
 
-    nist_file = NISTFile(str(fixture_path))
-    parsed = nist_file.parse()
+    nist_file, parsed = parsed_fixture(relative)
 
     if not should_parse:
         assert parsed is False
@@ -1,26 +1,12 @@
 """Smoke tests for MainWindow using pytest-qt and fixtures."""
 
-import os
 from pathlib import Path
 
-import pytest
-
-from mynist.views.main_window import MainWindow
-
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture(autouse=True)
-def offscreen(monkeypatch):
-    """Force Qt to use offscreen platform to avoid GUI requirements."""
-    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
-
-
-def test_load_type10_png_displays_pixmap(qtbot):
-    window = MainWindow()
-    qtbot.addWidget(window)
-
+def test_load_type10_png_displays_pixmap(window):
     src = FIXTURES / "type10" / "Interpol_FRA_24000000448327A_FI.nist"
     window.load_nist_file(str(src))
 
@@ -30,10 +16,7 @@ def test_load_type10_png_displays_pixmap(qtbot):
     assert pix is not None and not pix.isNull()
 
 
-def test_tree_contains_expected_types_for_palm(qtbot):
-    window = MainWindow()
-    qtbot.addWidget(window)
-
+def test_tree_contains_expected_types_for_palm(window):
     src = FIXTURES / "palm15" / "109018515_export_test.nist"
     window.load_nist_file(str(src))
 
@@ -43,10 +26,7 @@ def test_tree_contains_expected_types_for_palm(qtbot):
     assert any("Type-15" in label for label in top_labels)
 
 
-def test_selects_record_updates_data_panel(qtbot):
-    window = MainWindow()
-    qtbot.addWidget(window)
-
+def test_selects_record_updates_data_panel(window):
     src = FIXTURES / "type4" / "HR_12883247_3190184.nist"
     window.load_nist_file(str(src))
 
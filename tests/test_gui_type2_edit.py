@@ -1,23 +1,12 @@
 """Tests for Type-2 editing workflow (pytest-qt)."""
 
-import os
 from pathlib import Path
 import tempfile
 
-import pytest
-
-from mynist.views.main_window import MainWindow
-
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture(autouse=True)
-def offscreen(monkeypatch):
-    """Force Qt to offscreen to run headless."""
-    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
-
-
 def _find_row_for_field(table, field_key: str) -> int:
     for row in range(table.rowCount()):
         item = table.item(row, 0)
@@ -26,10 +15,7 @@ def _find_row_for_field(table, field_key: str) -> int:
     return -1
 
 
-def test_edit_type2_value_and_undo(qtbot):
-    window = MainWindow()
-    qtbot.addWidget(window)
-
+def test_edit_type2_value_and_undo(window):
     src = FIXTURES / "type4" / "HR_12883247_3190184.nist"
     window.load_nist_file(str(src))
 
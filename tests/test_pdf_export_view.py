@@ -0,0 +1,66 @@
+"""Tests for PdfExportView (deferred panels, icon tinting, current file)."""
+
+from PyQt5.QtCore import QEvent
+from PyQt5.QtGui import QColor, QPalette
+from PyQt5.QtWidgets import QApplication, QGroupBox, QPushButton
+
+from mynist.views.pdf_export_view import PdfExportView
+
+
+def _make_view(qtbot):
+    view = PdfExportView()
+    qtbot.addWidget(view)
+    return view
+
+
+def test_info_group_built_once_after_first_show(qtbot):
+    view = _make_view(qtbot)
+    assert view.findChild(QGroupBox, "infoGroup") is None
+
+    view.show()
+    qtbot.waitUntil(lambda: view.findChild(QGroupBox, "infoGroup") is not None)
+
+    view.hide()
+    view.show()
+    qtbot.wait(10)
+    assert len(view.findChildren(QGroupBox, "infoGroup")) == 1
+
+
+def test_palette_change_retints_button_icons(qapp, qtbot):
+    view = _make_view(qtbot)
+    back_btn = view.findChild(QPushButton, "backBtn")
+    keys_before = (back_btn.icon().cacheKey(), view.export_btn.icon().cacheKey())
+
+    original = QPalette(qapp.palette())
+    palette = QPalette(original)
+    palette.setColor(QPalette.WindowText, QColor("#ff0000"))
+    try:
+        qapp.setPalette(palette)
+        QApplication.sendEvent(view, QEvent(QEvent.PaletteChange))
+
+        assert view._icon_color == "#ff0000"
+        keys_after = (back_btn.icon().cacheKey(), view.export_btn.icon().cacheKey())
+        assert keys_after[0] != keys_before[0]
+        assert keys_after[1] != keys_before[1]
+    finally:
+        qapp.setPalette(original)
+
+
+def test_set_current_file_same_path_keeps_output_edit(qtbot, tmp_path):
+    view = _make_view(qtbot)
+    path = str(tmp_path / "sample.nist")
+
+    view.set_current_file(path)
+    assert view.output_input.text() == str(tmp_path / "sample.pdf")
+    edited = str(tmp_path / "custom.pdf")
+    view.output_input.setText(edited)
+
+    view.set_current_file(path)
+    assert view.output_input.text() == edited
+    assert view.source_label.text() == "sample.nist"
+
+    view.set_current_file(None)
+    assert view.current_file is None
+    assert view.output_input.text() == ""
+    assert not view.export_btn.isEnabled()
+    assert not view.close_btn.isEnabled()
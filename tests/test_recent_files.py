@@ -1,59 +1,99 @@
 """Tests for RecentFiles helper."""
 
-from pathlib import Path
+import pytest
 
-from mynist.utils.recent_files import RecentFiles
+from mynist.utils.recent_files import InMemoryStorage, RecentFiles
 
 
-def test_recent_files_add_and_get(tmp_path):
-    storage = tmp_path / "recent.json"
-    manager = RecentFiles(storage_path=storage, max_entries=2)
+class CountingStorage(InMemoryStorage):
+    """In-memory backend that counts writes."""
 
-    manager.add(str(tmp_path / "a.nist"), last_mode="viewer", summary_types=[2, 14])
-    manager.add(str(tmp_path / "b.nist"), last_mode="pdf", summary_types=[1, 2])
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
 
-    entries = manager.get_entries()
-    assert len(entries) == 2
-    assert entries[0]["path"].endswith("b.nist")
-    assert entries[0]["last_mode"] == "pdf"
-    assert entries[0]["summary_types"] == [1, 2]
+    def save(self, payload):
+        self.saves += 1
+        super().save(payload)
 
 
-def test_recent_files_dedup_and_limit(tmp_path):
-    storage = tmp_path / "recent.json"
-    manager = RecentFiles(storage_path=storage, max_entries=2)
+SCENARIOS = [
+    (
+        [
+            ("a.nist", {"last_mode": "viewer", "summary_types": [2, 14]}),
+            ("b.nist", {"last_mode": "pdf", "summary_types": [1, 2]}),
+        ],
+        [("b.nist", "pdf", [1, 2]), ("a.nist", "viewer", [2, 14])],
+    ),
+    (
+        [
+            ("a.nist", {}),
+            ("b.nist", {}),
+            ("a.nist", {}),  # dedup brings it to front
+            ("c.nist", {}),  # exceeds max_entries=2
+        ],
+        [("c.nist", "viewer", []), ("a.nist", "viewer", [])],
+    ),
+]
 
-    first = tmp_path / "a.nist"
-    second = tmp_path / "b.nist"
-    third = tmp_path / "c.nist"
 
-    manager.add(str(first))
-    manager.add(str(second))
-    manager.add(str(first))  # dedup brings it to front
-    manager.add(str(third))  # exceeds max_entries=2
+@pytest.mark.parametrize("adds, expected", SCENARIOS, ids=["add_and_get", "dedup_and_limit"])
+def test_recent_files_add_and_get(tmp_path, adds, expected):
+    manager = RecentFiles(storage=InMemoryStorage(), max_entries=2)
+    for name, options in adds:
+        manager.add(str(tmp_path / name), **options)
 
     entries = manager.get_entries()
-    assert len(entries) == 2
-    # a.nist re-added before c.nist should now be second after c
-    assert entries[0]["path"].endswith("c.nist")
-    assert entries[1]["path"].endswith("a.nist")
+    actual = [(e["path"], e["last_mode"], e["summary_types"]) for e in entries]
+    assert actual == [(str(tmp_path / name), mode, types) for name, mode, types in expected]
+
+
+def test_recent_files_add_many_saves_once(tmp_path):
+    storage = CountingStorage()
+    manager = RecentFiles(storage=storage, max_entries=2)
+
+    manager.add_many([str(tmp_path / name) for name in ("a.nist", "b.nist", "a.nist", "c.nist")])
+
+    assert storage.saves == 1
+    assert [e["path"] for e in manager.get_entries()] == [
+        str(tmp_path / "c.nist"),
+        str(tmp_path / "a.nist"),
+    ]
 
 
 def test_recent_files_filter_missing(tmp_path):
-    storage = tmp_path / "recent.json"
     present = tmp_path / "present.nist"
-    present.touch()
+    missing = tmp_path / "missing.nist"
 
-    manager = RecentFiles(storage_path=storage, max_entries=4)
+    manager = RecentFiles(
+        storage=InMemoryStorage(),
+        max_entries=4,
+        exists_fn=lambda path: path == str(present),
+    )
     manager.add(str(present))
-    manager.add(str(tmp_path / "missing.nist"))
+    manager.add(str(missing))
 
     entries_all = manager.get_entries()
     assert len(entries_all) == 2
-    exists_flags = {Path(item["path"]).name: item["exists"] for item in entries_all}
-    assert exists_flags["missing.nist"] is False
-    assert exists_flags["present.nist"] is True
+    # Newest first: missing.nist was added last
+    missing_entry, present_entry = entries_all
+    assert missing_entry["path"] == str(missing)
+    assert missing_entry["exists"] is False
+    assert present_entry["path"] == str(present)
+    assert present_entry["exists"] is True
 
     entries_only_existing = manager.get_entries(include_missing=False)
     assert len(entries_only_existing) == 1
-    assert entries_only_existing[0]["path"].endswith("present.nist")
+    assert entries_only_existing[0]["path"] == str(present)
+
+
+def test_recent_files_persist_to_json(tmp_path):
+    storage = tmp_path / "recent.json"
+    manager = RecentFiles(storage_path=storage, max_entries=2)
+    manager.add(str(tmp_path / "a.nist"), last_mode="pdf", summary_types=[1, 14])
+
+    reloaded = RecentFiles(storage_path=storage, max_entries=2).get_entries()
+    assert len(reloaded) == 1
+    assert reloaded[0]["path"] == str(tmp_path / "a.nist")
+    assert reloaded[0]["last_mode"] == "pdf"
+    assert reloaded[0]["summary_types"] == [1, 14]